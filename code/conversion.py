@@ -8,6 +8,7 @@ and attempts to download them using the y2mate.nu conversion service.
 Key Features:
 - Downloads songs from YouTube URLs stored in the database
 - Uses Selenium WebDriver for web automation
+- Processes several entries in parallel (one Chrome instance per worker)
 - Provides progress tracking with tqdm
 - Handles timeouts and errors gracefully
 - Updates database with download status
@@ -20,7 +21,10 @@ import time
 import logging
 import json
 import os
+import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Union, Tuple, Optional, Dict, Any
 from datetime import datetime, timedelta
 
@@ -30,6 +34,7 @@ from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException, WebDriverException
 
 # Automatically installs the correct ChromeDriver
 from webdriver_manager.chrome import ChromeDriverManager
@@ -43,6 +48,20 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("[INFO] tqdm not available. Recommended installation: pip install tqdm")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
 
 # =========================
 # CONFIGURATION - HARDCODED SETTINGS
@@ -50,11 +69,19 @@ except ImportError:
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 BASE_URL = "https://y2mate.nu/R2lu/"           # <--- Conversion website
 DATABASE_FILE = os.path.join(SCRIPT_DIR, 'tunes_database.json')  # <--- Database file
+JOURNAL_FILE = os.path.join(SCRIPT_DIR, 'tunes_database.jsonl')  # Entries added since the last full save
+DRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".autoyt2mp3_driver_path")  # Cached ChromeDriver path
 HEADLESS = True                           # Headless browser mode
 PAGE_LOAD_TIMEOUT = 20                    # Page load timeout in seconds
-IMPLICIT_WAIT = 1                         # Implicit wait for elements
+IMPLICIT_WAIT = 0                         # Implicit wait disabled (explicit waits only)
 EXPLICIT_WAIT = 2                         # Explicit wait for conditions
+ELEMENT_WAIT = 15                         # Wait for the conversion form to appear
+SAVE_EVERY = 10                           # Save database every N processed entries
+MAX_WORKERS = 3                           # Parallel Chrome instances
 HIGHLIGHT_MS = 400                        # Element highlighting duration
+DOWNLOAD_POLL_INTERVAL = 0.25             # Download folder polling interval without watchdog
+WORKER_DIR_PREFIX = ".worker"             # Per-worker download subfolders (parallel runs only)
+DEBUG_HIGHLIGHT = False                   # Outline elements before use (visible browser only)
 
 
 # =========================
@@ -70,6 +97,37 @@ log = logging.getLogger("selenium-generic")
 # =========================
 # CHROME WEBDRIVER SETUP
 # =========================
+def get_chromedriver_path(refresh: bool = False) -> str:
+    """
+    Return the ChromeDriver executable path, cached between runs.
+    
+    ChromeDriverManager().install() checks for updates over the network on every
+    call; its result is stored in DRIVER_PATH_CACHE and reused while the file exists.
+    
+    Args:
+        refresh (bool): Ignore the cached path and resolve it again
+        
+    Returns:
+        str: Path to the ChromeDriver executable
+    """
+    if not refresh and os.path.exists(DRIVER_PATH_CACHE):
+        try:
+            with open(DRIVER_PATH_CACHE, 'r', encoding='utf-8') as f:
+                cached_path = f.read().strip()
+            if cached_path and os.path.isfile(cached_path):
+                return cached_path
+        except OSError:
+            pass
+    
+    driver_path = ChromeDriverManager().install()
+    try:
+        with open(DRIVER_PATH_CACHE, 'w', encoding='utf-8') as f:
+            f.write(driver_path)
+    except OSError as e:
+        log.warning("Unable to cache ChromeDriver path: %s", e)
+    return driver_path
+
+
 def get_driver(headless: bool = False, download_dir: str = None) -> webdriver.Chrome:
     """
     Create and configure a Chrome WebDriver instance.
@@ -86,79 +144,164 @@ def get_driver(headless: bool = False, download_dir: str = None) -> webdriver.Ch
         os.makedirs(download_dir, exist_ok=True)
     
     options = ChromeOptions()
+    # Return from driver.get() at DOMContentLoaded: the form is in the initial HTML
+    options.page_load_strategy = "eager"
     if headless:
         options.add_argument("--headless=new")
     options.add_argument("--start-maximized")
     options.add_argument("--disable-gpu")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    # Images are not needed to drive the form (stylesheets are kept: visibility checks rely on layout)
+    options.add_argument("--blink-settings=imagesEnabled=false")
+    # ChromeDriver passes --disable-popup-blocking by default, which would void the popups pref below
+    options.add_experimental_option("excludeSwitches", ["enable-automation", "disable-popup-blocking"])
+    
+    prefs = {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.notifications": 2,
+        "profile.default_content_setting_values.popups": 2,  # Block script-opened ad popups
+    }
     
     # Configure downloads
     if download_dir:
-        prefs = {
+        prefs.update({
             "download.default_directory": download_dir,
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
             "safebrowsing.enabled": True
-        }
-        options.add_experimental_option("prefs", prefs)
+        })
         log.info("Download directory configured: %s", download_dir)
+    options.add_experimental_option("prefs", prefs)
     
-    driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
-        options=options
-    )
+    try:
+        driver = webdriver.Chrome(
+            service=ChromeService(executable_path=get_chromedriver_path()),
+            options=options
+        )
+    except WebDriverException as e:
+        # Cached driver may no longer match the installed Chrome version
+        log.warning("Cached ChromeDriver failed (%s), resolving it again", e.msg)
+        driver = webdriver.Chrome(
+            service=ChromeService(executable_path=get_chromedriver_path(refresh=True)),
+            options=options
+        )
     driver.set_page_load_timeout(PAGE_LOAD_TIMEOUT)
     driver.implicitly_wait(IMPLICIT_WAIT)
     
+    # Allow downloads explicitly (headless Chrome may otherwise drop them)
+    if download_dir:
+        try:
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow",
+                "downloadPath": os.path.abspath(download_dir)
+            })
+        except WebDriverException as e:
+            log.debug("Browser.setDownloadBehavior not applied: %s", e.msg)
+    
     return driver
 
 
 # =========================
 # DATABASE MANAGEMENT FUNCTIONS
 # =========================
+# True when entries changed since the last save
+_dirty = False
+
+# The journal and the load/save functions below are duplicated in code/update_db_from_txt.py and
+# manage_database.py (each script runs standalone): change the three copies together
+def read_journal():
+    """
+    Read the entries appended to the journal by update_db_from_txt.py since the last full save.
+    
+    Returns:
+        list: Journal entries (an incomplete last line from an interrupted run is skipped)
+    """
+    entries = []
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    pass
+    return entries
+
 def load_database():
     """
-    Load the existing database from JSON file.
+    Load the existing database from JSON file, followed by the journal entries.
+    
+    Exits if the database file exists but cannot be read, since the next save
+    would replace it with the journal entries only.
     
     Returns:
         list: Database entries or empty list if file doesn't exist
     """
+    global _dirty
+    data = []
     if os.path.exists(DATABASE_FILE):
         try:
-            with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+            if ORJSON_AVAILABLE:
+                with open(DATABASE_FILE, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (ValueError, OSError) as e:  # JSONDecodeError is a ValueError
+            log.error("Unable to read database '%s': %s", DATABASE_FILE, e)
+            sys.exit(1)
+    try:
+        data.extend(read_journal())
+    except OSError as e:
+        log.error("Unable to read journal '%s': %s", JOURNAL_FILE, e)
+    _dirty = False
+    return data
 
 def save_database(data):
     """
-    Save the database to JSON file.
+    Save the database to JSON file if it changed since the last save.
+    
+    Same atomic write as update_db_from_txt.save_database (temporary file then
+    os.replace); the journal is removed afterwards.
     
     Args:
         data (list): Database entries to save
     """
-    with open(DATABASE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    global _dirty
+    if not _dirty:
+        return
+    tmp_file = DATABASE_FILE + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, DATABASE_FILE)
+    if os.path.exists(JOURNAL_FILE):
+        os.remove(JOURNAL_FILE)
+    _dirty = False
 
-def update_database_entry(url, download_path, done_status=True):
+def set_entry_status(entry, download_path, done_status=True):
     """
-    Update a specific entry in the database.
+    Update an entry of the loaded database in place (call save_database to persist).
     
     Args:
-        url (str): YouTube URL to find in database
+        entry (dict): Entry object from the list returned by load_database
         download_path (str): Path where file was downloaded
         done_status (bool|str): Download status (True, False, or "timeout")
     """
-    database = load_database()
-    for entry in database:
-        if entry['url'] == url:
-            entry['done'] = done_status
-            if download_path:
-                entry['download_path'] = download_path
-            break
-    save_database(database)
+    global _dirty
+    _dirty = True
+    entry['done'] = done_status
+    if download_path:
+        entry['download_path'] = download_path
 
 
 # =========================
@@ -183,12 +326,15 @@ def is_visible(elem: WebElement) -> bool:
 def highlight(driver: webdriver.Chrome, elem: WebElement, ms: int = HIGHLIGHT_MS):
     """
     Add temporary visual border to element for debugging purposes.
+    Does nothing unless DEBUG_HIGHLIGHT is set and the browser is visible.
     
     Args:
         driver (webdriver.Chrome): WebDriver instance
         elem (WebElement): Element to highlight
         ms (int): Highlight duration in milliseconds
     """
+    if HEADLESS or not DEBUG_HIGHLIGHT:
+        return
     try:
         driver.execute_script("arguments[0].setAttribute('data-old-style', arguments[0].getAttribute('style') || '');", elem)
         driver.execute_script("arguments[0].style.outline='3px solid magenta'; arguments[0].style.outlineOffset='2px';", elem)
@@ -208,12 +354,14 @@ def short_label(elem: WebElement) -> str:
     Returns:
         str: Short description of the element
     """
-    tag = elem.tag_name.lower()
-    id_ = elem.get_attribute("id") or ""
-    name = elem.get_attribute("name") or ""
-    placeholder = elem.get_attribute("placeholder") or ""
-    aria = elem.get_attribute("aria-label") or ""
-    text = (elem.text or "").strip()
+    # One script call instead of one round-trip per attribute (elem.parent is the driver)
+    tag, id_, name, placeholder, aria, text = elem.parent.execute_script(
+        "const e = arguments[0];"
+        "return [e.tagName.toLowerCase(), e.id || '', e.getAttribute('name') || '',"
+        " e.getAttribute('placeholder') || '', e.getAttribute('aria-label') || '',"
+        " (e.innerText || '').trim()];",
+        elem
+    )
     text = " ".join(text.split())
     if len(text) > 60:
         text = text[:57] + "..."
@@ -261,12 +409,11 @@ def list_text_boxes(driver: webdriver.Chrome, do_highlight: bool = True) -> List
         "textarea",
         "[contenteditable='true']",
     ]
-    elems: List[WebElement] = []
-    for sel in selectors:
-        try:
-            elems.extend(driver.find_elements(By.CSS_SELECTOR, sel))
-        except Exception:
-            pass
+    # Single grouped query: one RPC and one querySelectorAll instead of one per selector
+    try:
+        elems: List[WebElement] = driver.find_elements(By.CSS_SELECTOR, ", ".join(selectors))
+    except Exception:
+        elems = []
 
     # Filter for visible, unique elements (by id)
     uniq: List[WebElement] = []
@@ -274,7 +421,7 @@ def list_text_boxes(driver: webdriver.Chrome, do_highlight: bool = True) -> List
     for e in elems:
         if not is_visible(e):
             continue
-        key = (e.id, e.get_attribute("outerHTML")[:120])
+        key = e.id  # WebDriver element ids are unique per DOM node
         if key in seen:
             continue
         seen.add(key)
@@ -284,7 +431,8 @@ def list_text_boxes(driver: webdriver.Chrome, do_highlight: bool = True) -> List
     for i, e in enumerate(uniq):
         if do_highlight:
             highlight(driver, e)
-        log.info("[%02d] %s", i, short_label(e))
+        if log.isEnabledFor(logging.INFO):
+            log.info("[%02d] %s", i, short_label(e))
     return uniq
 
 
@@ -306,12 +454,11 @@ def list_buttons(driver: webdriver.Chrome, do_highlight: bool = True) -> List[We
         "*[onclick]",
         "*[tabindex]",
     ]
-    elems: List[WebElement] = []
-    for sel in selectors:
-        try:
-            elems.extend(driver.find_elements(By.CSS_SELECTOR, sel))
-        except Exception:
-            pass
+    # Single grouped query: one RPC and one querySelectorAll instead of one per selector
+    try:
+        elems: List[WebElement] = driver.find_elements(By.CSS_SELECTOR, ", ".join(selectors))
+    except Exception:
+        elems = []
 
     # Filtrer visibles et semblant cliquables
     uniq: List[WebElement] = []
@@ -319,8 +466,8 @@ def list_buttons(driver: webdriver.Chrome, do_highlight: bool = True) -> List[We
     for e in elems:
         if not is_visible(e):
             continue
-        # éliminer des doublons grossiers
-        key = (e.id, e.get_attribute("outerHTML")[:120])
+        # éliminer les doublons
+        key = e.id  # WebDriver element ids are unique per DOM node
         if key in seen:
             continue
         seen.add(key)
@@ -330,7 +477,8 @@ def list_buttons(driver: webdriver.Chrome, do_highlight: bool = True) -> List[We
     for i, e in enumerate(uniq):
         if do_highlight:
             highlight(driver, e)
-        log.info("[%02d] %s", i, short_label(e))
+        if log.isEnabledFor(logging.INFO):
+            log.info("[%02d] %s", i, short_label(e))
     return uniq
 
 
@@ -365,6 +513,42 @@ def enter_text_in_box(driver: webdriver.Chrome,
     return False
 
 
+def set_input_value_fast(driver: webdriver.Chrome, elem: WebElement, value: str) -> bool:
+    """
+    Set an input's value in a single script call and fire input/change events.
+    
+    The native value setter is used so that frameworks wrapping the property
+    (React, Vue...) register the change, and the value is read back afterwards.
+    
+    Args:
+        driver (webdriver.Chrome): WebDriver instance
+        elem (WebElement): Input element to fill
+        value (str): Value to set
+        
+    Returns:
+        bool: True if the input holds the value, False if the caller should fall back to send_keys
+    """
+    try:
+        current = driver.execute_script(
+            "const e = arguments[0];"
+            "const proto = e instanceof HTMLTextAreaElement"
+            "    ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;"
+            "e.focus();"
+            "Object.getOwnPropertyDescriptor(proto, 'value').set.call(e, arguments[1]);"
+            "e.dispatchEvent(new Event('input', {bubbles: true}));"
+            "e.dispatchEvent(new Event('change', {bubbles: true}));"
+            "return e.value;",
+            elem, value
+        )
+    except Exception as e:
+        log.debug("Erreur set_input_value_fast: %s", e)
+        return False
+    if current != value:
+        log.debug("set_input_value_fast: valeur non prise en compte (%r)", current)
+        return False
+    return True
+
+
 def click_button(driver: webdriver.Chrome,
                  index_or_elem: Union[int, WebElement]) -> bool:
     """
@@ -406,11 +590,9 @@ def press_key(driver: webdriver.Chrome,
     try:
         if target == "active":
             active = driver.switch_to.active_element
-            highlight(driver, active)
             active.send_keys(key_value)
         else:
             body = driver.find_element(By.TAG_NAME, "body")
-            highlight(driver, body)
             body.send_keys(key_value)
         log.info("Touche envoyée: %s sur %s", key, target)
         return True
@@ -422,31 +604,131 @@ def press_key(driver: webdriver.Chrome,
 # =========================
 # DOWNLOAD HELPERS
 # =========================
+TEMP_DOWNLOAD_SUFFIXES = ('.crdownload', '.tmp', '.part')
+
+
+class DownloadHandler(FileSystemEventHandler):
+    """Watchdog handler signalling the first completed file created in a folder."""
+
+    def __init__(self, initial_files: set):
+        super().__init__()
+        self.initial_files = initial_files
+        self.filename: Optional[str] = None
+        self.done = threading.Event()
+
+    def _check(self, path: str):
+        name = os.path.basename(path)
+        if name in self.initial_files or name.endswith(TEMP_DOWNLOAD_SUFFIXES):
+            return
+        if self.filename is None:
+            self.filename = name
+        self.done.set()
+
+    def on_created(self, event):
+        if not event.is_directory:
+            self._check(event.src_path)
+
+    def on_moved(self, event):
+        # Chrome renames the .crdownload file once the download completes
+        if not event.is_directory:
+            self._check(event.dest_path)
+
+
+def find_new_download(download_dir: str, initial_files: set) -> Optional[str]:
+    """Retourne le premier fichier terminé absent de initial_files, ou None."""
+    try:
+        with os.scandir(download_dir) as it:
+            for entry in it:
+                # Ignorer les fichiers déjà présents et temporaires (.crdownload, .tmp, .part)
+                if entry.name in initial_files or entry.name.endswith(TEMP_DOWNLOAD_SUFFIXES):
+                    continue
+                return entry.name
+    except FileNotFoundError:
+        pass
+    return None
+
+
 def wait_for_download(download_dir: str, timeout: int = 30) -> Optional[str]:
-    """Attend qu'un fichier soit téléchargé et retourne son nom."""
-    log.info("Attente du téléchargement dans: %s", download_dir)
-    start_time = time.time()
+    """
+    Attend qu'un fichier soit téléchargé et retourne son nom.
+    
+    Avec watchdog, attend l'événement système de création du fichier;
+    sinon, interroge le dossier toutes les DOWNLOAD_POLL_INTERVAL secondes.
+    """
+    log.debug("Attente du téléchargement dans: %s", download_dir)
     initial_files = set(os.listdir(download_dir)) if os.path.exists(download_dir) else set()
+    downloaded_file = None
     
-    while time.time() - start_time < timeout:
-        if os.path.exists(download_dir):
-            current_files = set(os.listdir(download_dir))
-            new_files = current_files - initial_files
-            
-            # Filtrer les fichiers temporaires (.crdownload, .tmp)
-            completed_files = [f for f in new_files if not f.endswith(('.crdownload', '.tmp', '.part'))]
-            
-            if completed_files:
-                downloaded_file = completed_files[0]
-                log.info("Fichier téléchargé: %s", downloaded_file)
-                return downloaded_file
-        
-        time.sleep(1)
+    if WATCHDOG_AVAILABLE and os.path.isdir(download_dir):
+        handler = DownloadHandler(initial_files)
+        observer = Observer()
+        observer.schedule(handler, download_dir, recursive=False)
+        observer.start()
+        try:
+            # Le fichier a pu apparaître avant le démarrage de l'observateur
+            downloaded_file = find_new_download(download_dir, initial_files)
+            if not downloaded_file and handler.done.wait(timeout):
+                downloaded_file = handler.filename
+        finally:
+            observer.stop()
+            observer.join()
+    else:
+        start_time = time.time()
+        while time.time() - start_time < timeout:
+            downloaded_file = find_new_download(download_dir, initial_files)
+            if downloaded_file:
+                break
+            time.sleep(DOWNLOAD_POLL_INTERVAL)
+    
+    if downloaded_file:
+        log.debug("Fichier téléchargé: %s", downloaded_file)
+        return downloaded_file
     
     log.warning("Aucun téléchargement détecté après %d secondes", timeout)
     return None
 
 
+# Serialise les déplacements: deux workers peuvent livrer un fichier du même nom
+_move_lock = threading.Lock()
+
+
+def move_download(src_dir: str, filename: str, dest_dir: str) -> str:
+    """
+    Move a finished download into dest_dir, renaming it "name (n).ext" on a name clash like Chrome.
+    
+    Returns:
+        str: File name in dest_dir
+    """
+    base, ext = os.path.splitext(filename)
+    with _move_lock:
+        target, n = filename, 1
+        while os.path.exists(os.path.join(dest_dir, target)):
+            target = f"{base} ({n}){ext}"
+            n += 1
+        shutil.move(os.path.join(src_dir, filename), os.path.join(dest_dir, target))
+    return target
+
+
+def collect_worker_downloads(worker_dir: str, download_dir: str):
+    """
+    Move the downloads finished after their entry was processed into download_dir,
+    then remove the worker folder if nothing is left in it.
+    """
+    if not os.path.isdir(worker_dir):
+        return
+    for name in os.listdir(worker_dir):
+        if name.endswith(TEMP_DOWNLOAD_SUFFIXES) or not os.path.isfile(os.path.join(worker_dir, name)):
+            continue
+        try:
+            move_download(worker_dir, name, download_dir)
+        except OSError as e:
+            log.error("Impossible de déplacer '%s': %s", name, e)
+    try:
+        os.rmdir(worker_dir)
+    except OSError:
+        log.warning("Téléchargements incomplets laissés dans %s", worker_dir)
+
+
 # =========================
 # PIPELINE PRINCIPAL
 # =========================
@@ -461,60 +743,48 @@ def find_input_by_id(driver: webdriver.Chrome, target_id: str) -> Optional[WebEl
     return None
 
 
+# Recherche exécutée dans le navigateur: un seul aller-retour WebDriver
+# Les groupes sont parcourus par priorité: un conteneur avec onclick/tabindex précède son
+# bouton dans l'ordre du document et contient son texte, il ne doit pas gagner
+FIND_BUTTON_JS = """
+const needle = arguments[0].toLowerCase();
+const groups = [
+    "button, input[type='button'], input[type='submit'], input[type='reset'], input[type='image']",
+    "[role='button']",
+    "a, *[onclick], *[tabindex]"
+];
+for (const selector of groups) {
+    for (const e of document.querySelectorAll(selector)) {
+        if (e.offsetWidth <= 0 || e.offsetHeight <= 0 || !e.getClientRects().length) continue;
+        const label = ((e.innerText || "") + " " + (e.value || "")).toLowerCase();
+        if (label.includes(needle)) return e;
+    }
+}
+return null;
+"""
+
+
 def find_button_by_text(driver: webdriver.Chrome, text: str) -> Optional[WebElement]:
-    """Trouve un bouton contenant le texte spécifié (insensible à la casse)."""
-    buttons = list_buttons(driver, do_highlight=False)
-    for btn in buttons:
-        btn_text = (btn.text or "").strip().lower()
-        value = (btn.get_attribute("value") or "").strip().lower()
-        if text.lower() in btn_text or text.lower() in value:
-            return btn
-    return None
+    """Trouve un bouton visible contenant le texte spécifié (insensible à la casse)."""
+    try:
+        return driver.execute_script(FIND_BUTTON_JS, text)
+    except Exception as e:
+        log.debug("Erreur find_button_by_text: %s", e)
+        return None
 
 
 def wait_for_button_with_text(driver: webdriver.Chrome, text: str, timeout: int = 60) -> Optional[WebElement]:
     """Attend qu'un bouton avec le texte spécifié apparaisse."""
-    log.info("Attente du bouton contenant '%s'...", text)
-    start_time = time.time()
-    while time.time() - start_time < timeout:
-        try:
-            # Utiliser XPath pour chercher plus largement
-            xpath_queries = [
-                f"//button[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]",
-                f"//input[@type='button'][contains(translate(@value, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]",
-                f"//input[@type='submit'][contains(translate(@value, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]",
-                f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')][@onclick or @role='button']",
-                f"//a[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{text.lower()}')]"
-            ]
-            
-            for xpath in xpath_queries:
-                try:
-                    elements = driver.find_elements(By.XPATH, xpath)
-                    for elem in elements:
-                        if is_visible(elem):
-                            log.info("Bouton '%s' trouvé avec XPath!", text)
-                            return elem
-                except Exception:
-                    continue
-                    
-            # Si pas trouvé avec XPath, essayer la méthode classique
-            btn = find_button_by_text(driver, text)
-            if btn:
-                log.info("Bouton '%s' trouvé avec méthode classique!", text)
-                return btn
-                
-        except Exception as e:
-            log.debug("Erreur lors de la recherche du bouton: %s", e)
-            
-        time.sleep(1)
-        
-        # Log du progrès toutes les 10 secondes
-        elapsed = time.time() - start_time
-        if int(elapsed) % 10 == 0:
-            log.info("Recherche en cours... %d/%d secondes", int(elapsed), timeout)
-    
-    log.error("Timeout: bouton '%s' non trouvé après %d secondes", text, timeout)
-    return None
+    log.debug("Attente du bouton contenant '%s'...", text)
+    try:
+        btn = WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            lambda d: find_button_by_text(d, text)
+        )
+        log.debug("Bouton '%s' trouvé!", text)
+        return btn
+    except TimeoutException:
+        log.error("Timeout: bouton '%s' non trouvé après %d secondes", text, timeout)
+        return None
 
 
 def close_new_tabs(driver: webdriver.Chrome, original_window: str):
@@ -522,38 +792,203 @@ def close_new_tabs(driver: webdriver.Chrome, original_window: str):
     try:
         current_windows = driver.window_handles
         if len(current_windows) > 1:
-            log.info("Détection de %d onglets ouverts, fermeture des nouveaux onglets", len(current_windows))
+            log.debug("Détection de %d onglets ouverts, fermeture des nouveaux onglets", len(current_windows))
             for window in current_windows:
                 if window != original_window:
                     driver.switch_to.window(window)
                     driver.close()
-                    log.info("Onglet fermé")
+                    log.debug("Onglet fermé")
             # Retourner sur l'onglet original
             driver.switch_to.window(original_window)
-            log.info("Retour sur l'onglet original")
+            log.debug("Retour sur l'onglet original")
     except Exception as e:
         log.error("Erreur lors de la fermeture des onglets: %s", e)
 
 
-def process_file(driver: webdriver.Chrome, base_url: str, download_dir: str):
+def open_conversion_form(driver: webdriver.Chrome, base_url: str) -> Optional[WebElement]:
+    """
+    Load the conversion page and return its URL input (id="v").
+    
+    The page is loaded for every entry: after a conversion y2mate.nu keeps the
+    previous Download button on screen, so the form cannot be reused.
+    
+    Args:
+        driver (webdriver.Chrome): WebDriver instance
+        base_url (str): Conversion website URL
+        
+    Returns:
+        WebElement|None: Visible input element, or None if not found
+    """
+    log.debug("Navigation vers %s", base_url)
+    driver.get(base_url)
+    try:
+        WebDriverWait(driver, ELEMENT_WAIT).until(EC.presence_of_element_located((By.ID, "v")))
+    except TimeoutException:
+        pass
+    return find_input_by_id(driver, "v")
+
+
+# Remplissage par script: None tant qu'aucune conversion ne l'a confirmé,
+# False si le site l'ignore (saisie au clavier uniquement)
+_fast_fill: Optional[bool] = None
+
+
+def start_conversion(driver: webdriver.Chrome, base_url: str, url: str,
+                     fast: bool = True) -> Optional[bool]:
+    """
+    Enter a video URL in the conversion form and click the "Convert" button.
+    
+    Args:
+        driver (webdriver.Chrome): WebDriver instance
+        base_url (str): Conversion website URL
+        url (str): Video URL to convert
+        fast (bool): Try set_input_value_fast before typing the URL
+        
+    Returns:
+        bool|None: True if the URL was set by script, False if it was typed,
+        None if the form or the "Convert" button could not be found
+    """
+    # 1. Trouver l'input avec id="v" et y entrer l'URL
+    input_elem = open_conversion_form(driver, base_url)
+    if not input_elem:
+        log.error("Input avec id='v' non trouvé sur la page")
+        return None
+    
+    log.debug("Saisie de l'URL dans l'input id='v'")
+    filled_by_script = fast and set_input_value_fast(driver, input_elem, url)
+    if not filled_by_script:
+        input_elem.clear()
+        input_elem.click()
+        input_elem.send_keys(url)
+
+    # 2. Cliquer sur le bouton "Convert"
+    try:
+        convert_btn = WebDriverWait(driver, EXPLICIT_WAIT).until(
+            lambda d: find_button_by_text(d, "Convert")
+        )
+    except TimeoutException:
+        log.error("Bouton 'Convert' non trouvé")
+        return None
+    log.debug("Clic sur le bouton Convert")
+    convert_btn.click()
+    return filled_by_script
+
+
+def process_entry(driver: webdriver.Chrome, base_url: str, download_dir: str,
+                  item: Dict[str, Any], worker_dir: Optional[str] = None) -> Optional[Union[bool, str]]:
+    """
+    Convert and download a single database entry.
+    
+    Args:
+        driver (webdriver.Chrome): WebDriver instance owned by the calling worker
+        base_url (str): Conversion website URL
+        download_dir (str): Directory where files are downloaded
+        item (dict): Database entry to process (not modified)
+        worker_dir (str|None): Folder the driver downloads into, if not download_dir;
+            only this worker writes there, so the file found belongs to this entry
+        
+    Returns:
+        bool|str|None: True on success, "timeout" on timeout or error,
+        None if the conversion form could not be used (entry left untouched)
+    """
+    global _fast_fill
+    url = item.get("url", "")
+    
+    try:
+        filled_by_script = start_conversion(driver, base_url, url, fast=_fast_fill is not False)
+        if filled_by_script is None:
+            return None
+
+        # 3. Attendre et cliquer sur le bouton "Download" (polling immédiat, pas de pause fixe)
+        download_btn = wait_for_button_with_text(driver, "Download", timeout=60)
+        if not download_btn and filled_by_script and _fast_fill is None:
+            # La valeur posée par script n'a peut-être pas été vue par le site: réessayer au clavier
+            log.warning("Conversion non démarrée après remplissage par script, nouvel essai au clavier")
+            if start_conversion(driver, base_url, url, fast=False) is None:
+                return None
+            download_btn = wait_for_button_with_text(driver, "Download", timeout=60)
+            if download_btn:
+                log.warning("Remplissage par script désactivé, saisie au clavier pour la suite")
+                _fast_fill = False
+        elif download_btn and filled_by_script:
+            _fast_fill = True
+        if not download_btn:
+            log.error("Bouton 'download' non trouvé - TIMEOUT détecté")
+            return "timeout"
+        
+        log.debug("Clic sur le bouton download")
+        download_btn.click()
+        
+        # Sauvegarder l'onglet actuel avant la fermeture des popups
+        original_window = driver.current_window_handle
+        
+        # A tab opened by the (trusted) click itself is not blocked by the popups pref:
+        # wait briefly for it, then close it
+        try:
+            WebDriverWait(driver, EXPLICIT_WAIT).until(lambda d: len(d.window_handles) > 1)
+        except TimeoutException:
+            pass
+        close_new_tabs(driver, original_window)
+        
+        # Check if download started
+        watch_dir = worker_dir or download_dir
+        downloaded_file = wait_for_download(watch_dir, timeout=10)
+        if downloaded_file and worker_dir:
+            downloaded_file = move_download(worker_dir, downloaded_file, download_dir)
+        if downloaded_file:
+            log.debug("Download confirmed: %s", downloaded_file)
+        else:
+            log.warning("No download detected, but process considered successful")
+        
+        return True
+
+    except Exception as e:
+        log.error("Error on entry '%s': %s", item.get("title", ""), e)
+        # Try to recover by reloading the page
+        try:
+            log.debug("Attempting recovery...")
+            driver.get(base_url)
+        except Exception:
+            log.error("Unable to recover, moving to next entry")
+        # Mark as timeout in case of unexpected error
+        return "timeout"
+
+
+def process_file(base_url: str, download_dir: str, workers: int = MAX_WORKERS):
+    """
+    Process every entry of the database that has not been downloaded yet.
+    
+    Pending entries are split across up to `workers` Chrome instances running in
+    threads (the work is I/O bound). Results are applied to the in-memory
+    database under a lock and saved every SAVE_EVERY entries. With several
+    workers, each Chrome downloads into its own subfolder of download_dir so a
+    download can be matched to its entry; files are moved into download_dir.
+    
+    Args:
+        base_url (str): Conversion website URL
+        download_dir (str): Directory where files are downloaded
+        workers (int): Maximum number of parallel Chrome instances
+    """
     # Lire les données depuis la base de données
     data = load_database()
     log.info("Base de données '%s' : %d entrées", DATABASE_FILE, len(data))
     
-    # Compter les entrées à traiter
-    entries_to_process = [item for item in data if item.get("done", False) is not True]
+    # Entrées à traiter, avec leur position dans la base (numérotation de manage_database.py)
+    entries_to_process = [(idx, item) for idx, item in enumerate(data, 1) if item.get("done", False) is not True]
     total_entries = len(entries_to_process)
     
     if total_entries == 0:
         log.info("Toutes les entrées sont déjà traitées!")
         return
     
-    log.info("Entrées à traiter: %d sur %d", total_entries, len(data))
+    workers = max(1, min(workers, total_entries))
+    log.info("Entrées à traiter: %d sur %d (%d workers)", total_entries, len(data), workers)
     
     # Initialiser les variables de progression
     start_time = datetime.now()
-    processed_count = 0
-    successful_downloads = 0
+    stats = {"processed": 0, "successful": 0, "unsaved": 0}
+    lock = threading.Lock()
+    stop = threading.Event()  # Set on Ctrl-C: workers stop after their current entry
     
     # Initialiser la barre de progression
     if TQDM_AVAILABLE:
@@ -561,173 +996,114 @@ def process_file(driver: webdriver.Chrome, base_url: str, download_dir: str):
             total=total_entries,
             desc="Téléchargement",
             unit="fichier",
+            mininterval=0.5,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
         )
     
-    for idx, item in enumerate(data, 1):
+    def on_result(item: Dict[str, Any], status: Optional[Union[bool, str]]):
+        """Apply one worker result to the database and progress counters."""
         title = item.get("title", "")
-        url = item.get("url", "")
-        done_status = item.get("done", False)
-        
-        # Ignorer les éléments déjà traités avec succès
-        if done_status is True:
-            log.info("=== [Entrée %d/%d] '%s' - DÉJÀ TRAITÉE ===", idx, len(data), title)
-            continue
-            
-        # Calculer l'estimation de temps
-        elapsed_time = datetime.now() - start_time
-        if processed_count > 0:
-            avg_time_per_item = elapsed_time / processed_count
-            remaining_items = total_entries - processed_count
-            estimated_remaining = avg_time_per_item * remaining_items
-            estimated_end = datetime.now() + estimated_remaining
-            
-            progress_info = f"ETA: {estimated_end.strftime('%H:%M:%S')} ({estimated_remaining})"
-        else:
-            progress_info = "Calcul en cours..."
-        
-        log.info("=== [Entrée %d/%d] '%s' ===", idx, len(data), title)
-        if TQDM_AVAILABLE:
-            progress_bar.set_description(f"Traitement: {title[:30]}...")
-            progress_bar.set_postfix_str(progress_info)
-        
-        # Marquer comme en cours de traitement
-        timeout_detected = False
-        success = False
-        
-        try:
-            # Aller sur la page de base
-            log.info("Navigation vers %s", base_url)
-            driver.get(base_url)
-            wait_dom_ready(driver)
-            time.sleep(3)  # Laisser le temps à la page de se charger complètement
-
-            # 1. Trouver l'input avec id="v" et y entrer l'URL
-            input_elem = find_input_by_id(driver, "v")
-            if not input_elem:
-                log.error("Input avec id='v' non trouvé sur la page")
-                continue
-            
-            log.info("Saisie de l'URL dans l'input id='v'")
-            highlight(driver, input_elem)
-            input_elem.clear()
-            input_elem.click()
-            input_elem.send_keys(url)
-            time.sleep(1)
-
-            # 2. Cliquer sur le bouton "Convert"
-            convert_btn = find_button_by_text(driver, "Convert")
-            if not convert_btn:
-                log.error("Bouton 'Convert' non trouvé")
-                continue
-            
-            log.info("Clic sur le bouton Convert")
-            highlight(driver, convert_btn)
-            convert_btn.click()
-            time.sleep(3)  # Attendre que la conversion commence
-
-            # 3. Attendre et cliquer sur le bouton "Download"
-            download_btn = wait_for_button_with_text(driver, "Download", timeout=60)
-            if not download_btn:
-                log.error("Bouton 'download' non trouvé - TIMEOUT détecté")
-                timeout_detected = True
-            else:
-                log.info("Clic sur le bouton download")
-                highlight(driver, download_btn)
-                download_btn.click()
-                
-                # # 4. Attendre 2 secondes puis appuyer sur Enter
-                # log.info("Attente de 2 secondes puis pression de Enter")
-                # time.sleep(2)
-                
-                # Sauvegarder l'onglet actuel avant d'appuyer sur Enter
-                original_window = driver.current_window_handle
-                
-                # try:
-                #     press_key(driver, "ENTER", target="active")
-                #     log.info("Touche Enter envoyée avec succès")
-                # except Exception as e:
-                #     log.warning("Erreur lors de l'envoi de Enter: %s", e)
-                #     # Essayer sur le body si l'élément actif ne fonctionne pas
-                #     try:
-                #         press_key(driver, "ENTER", target="page")
-                #         log.info("Touche Enter envoyée sur la page")
-                #     except Exception as e2:
-                #         log.error("Impossible d'envoyer Enter: %s", e2)
-                
-                # Wait for new tabs to open then close them
-                time.sleep(1)
-                close_new_tabs(driver, original_window)
-                
-                # Check if download started
-                downloaded_file = wait_for_download(download_dir, timeout=10)
-                if downloaded_file:
-                    log.info("Download confirmed: %s", downloaded_file)
+        with lock:
+            if status is not None:
+                # item is the entry object from data: update it directly, not by URL
+                # (several entries may share a URL)
+                if status is True:
+                    set_entry_status(item, download_dir, True)
+                    log.info("Status updated: success for '%s'", title)
+                    stats["successful"] += 1
                 else:
-                    log.warning("No download detected, but process considered successful")
-                
-                success = True
-            
-            # Update status in database with new download_path
-            if timeout_detected:
-                item["done"] = "timeout"
-                log.warning("Status updated: timeout for '%s'", title)
-                update_database_entry(url, download_dir, "timeout")
-            elif success:
-                item["done"] = True
-                log.info("Status updated: success for '%s'", title)
-                update_database_entry(url, download_dir, True)
-                # Update download_path in current entry as well
-                item["download_path"] = download_dir
-                successful_downloads += 1
-            
-            # Update progress counters
-            processed_count += 1
+                    set_entry_status(item, None, status)
+                    log.warning("Status updated: %s for '%s'", status, title)
+                stats["processed"] += 1
+                stats["unsaved"] += 1
             
             # Update progress bar
             if TQDM_AVAILABLE:
                 progress_bar.update(1)
-                success_rate = (successful_downloads / processed_count) * 100
-                progress_bar.set_postfix_str(f"Success: {successful_downloads}/{processed_count} ({success_rate:.1f}%)")
+                if stats["processed"] > 0:
+                    success_rate = (stats["successful"] / stats["processed"]) * 100
+                    progress_bar.set_postfix_str(
+                        f"Success: {stats['successful']}/{stats['processed']} ({success_rate:.1f}%)"
+                    )
             
-            # Small pause before next entry
-            time.sleep(2)
-            if success:
-                log.info("Processing of entry %d completed successfully", idx)
-
-        except Exception as e:
-            log.error("Error on entry '%s': %s", title, e)
-            # Mark as timeout in case of unexpected error
-            item["done"] = "timeout"
-            processed_count += 1
-            
-            # Update progress bar even on error
-            if TQDM_AVAILABLE:
-                progress_bar.update(1)
-                success_rate = (successful_downloads / processed_count) * 100
-                progress_bar.set_postfix_str(f"Success: {successful_downloads}/{processed_count} ({success_rate:.1f}%)")
-            
-            # Try to recover by reloading the page
+            # Save database every SAVE_EVERY processed entries (final save below)
+            if stats["unsaved"] >= SAVE_EVERY:
+                try:
+                    save_database(data)
+                    stats["unsaved"] = 0
+                    log.debug("Database saved with new status")
+                except Exception as e:
+                    log.error("Error saving database: %s", e)
+    
+    def run_worker(driver: webdriver.Chrome, chunk: List[Tuple[int, Dict[str, Any]]],
+                   worker_dir: Optional[str]):
+        """Process a share of the pending entries with a dedicated driver."""
+        for idx, item in chunk:
+            if stop.is_set():
+                break
+            log.debug("=== [Entrée %d/%d] '%s' ===", idx, len(data), item.get("title", ""))
+            on_result(item, process_entry(driver, base_url, download_dir, item, worker_dir))
+    
+    # Répartir les entrées en alternance entre les workers
+    chunks = [entries_to_process[i::workers] for i in range(workers)]
+    # Un seul worker: pas d'ambiguïté, téléchargement direct dans download_dir
+    worker_dirs = [None] if workers == 1 else [
+        os.path.join(download_dir, f"{WORKER_DIR_PREFIX}{i + 1}") for i in range(workers)
+    ]
+    
+    # Drivers created sequentially (ChromeDriverManager is not safe to run concurrently)
+    drivers: List[webdriver.Chrome] = []
+    try:
+        for worker_dir in worker_dirs:
+            drivers.append(get_driver(headless=HEADLESS, download_dir=worker_dir or download_dir))
+        
+        executor = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = [executor.submit(run_worker, drv, chunk, worker_dir)
+                       for drv, chunk, worker_dir in zip(drivers, chunks, worker_dirs)]
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    log.error("Worker stopped with an error: %s", e)
+        except BaseException:
+            stop.set()
+            log.warning("Interrupted: waiting for workers to finish their current entry...")
+            raise
+        finally:
+            # Drivers must not be quit while a worker still uses them
+            while True:
+                try:
+                    executor.shutdown(wait=True)
+                    break
+                except KeyboardInterrupt:
+                    stop.set()
+                    log.warning("Still waiting for workers to finish their current entry...")
+    finally:
+        for drv in drivers:
             try:
-                log.info("Attempting recovery...")
-                driver.get(base_url)
-                time.sleep(2)
+                drv.quit()
             except Exception:
-                log.error("Unable to recover, moving to next entry")
-            continue
+                pass
+        for worker_dir in worker_dirs:
+            if worker_dir:
+                collect_worker_downloads(worker_dir, download_dir)
         
-        # Save database after each processed entry
+        # Close progress bar
+        if TQDM_AVAILABLE:
+            progress_bar.close()
+        
+        # Final save
         try:
-            save_database(data)
-            log.info("Database saved with new status")
+            with lock:
+                save_database(data)
+            log.info("Final database save completed")
         except Exception as e:
-            log.error("Error saving database: %s", e)
-    
-    # Close progress bar
-    if TQDM_AVAILABLE:
-        progress_bar.close()
+            log.error("Error during final save: %s", e)
     
     # Display final statistics
+    processed_count = stats["processed"]
+    successful_downloads = stats["successful"]
     total_time = datetime.now() - start_time
     log.info("=== FINAL SUMMARY ===")
     log.info("Total time: %s", str(total_time).split('.')[0])
@@ -738,13 +1114,6 @@ def process_file(driver: webdriver.Chrome, base_url: str, download_dir: str):
         log.info("Success rate: %.1f%%", success_rate)
         avg_time = total_time / processed_count
         log.info("Average time per entry: %s", str(avg_time).split('.')[0])
-    
-    # Final save
-    try:
-        save_database(data)
-        log.info("Final database save completed")
-    except Exception as e:
-        log.error("Error during final save: %s", e)
 
 
 # =========================
@@ -752,16 +1121,21 @@ def process_file(driver: webdriver.Chrome, base_url: str, download_dir: str):
 # =========================
 if __name__ == "__main__":
     # Command line arguments handling
-    if len(sys.argv) != 2:
-        print("Usage: python conversion.py <download_directory>")
+    args = [arg for arg in sys.argv[1:] if arg != "--verbose"]
+    if len(args) != 1:
+        print("Usage: python conversion.py <download_directory> [--verbose]")
         print("  download_directory : folder where to download files")
+        print("  --verbose          : log every step of each conversion")
         sys.exit(1)
     
-    download_dir = sys.argv[1]
+    if "--verbose" in sys.argv[1:]:
+        log.setLevel(logging.DEBUG)  # Not the root logger: selenium/urllib3/watchdog debug output would bury the steps
+    
+    download_dir = args[0]
     print(f"[INFO] Download directory: {download_dir}")
     
     # Check that database exists
-    if not os.path.exists(DATABASE_FILE):
+    if not os.path.exists(DATABASE_FILE) and not os.path.exists(JOURNAL_FILE):
         print(f"[ERROR] Database '{DATABASE_FILE}' does not exist.")
         sys.exit(1)
     
@@ -772,9 +1146,5 @@ if __name__ == "__main__":
     
     print(f"[INFO] Database: {DATABASE_FILE}")
     
-    driver = get_driver(headless=HEADLESS, download_dir=download_dir)
-    try:
-        process_file(driver, BASE_URL, download_dir)
-        log.info("Completed.")
-    finally:
-        driver.quit()
+    process_file(BASE_URL, download_dir)
+    log.info("Completed.")
@@ -6,26 +6,34 @@ It searches for songs on YouTube, extracts video URLs, detects duplicates,
 and updates the centralized database with new entries.
 
 Key Features:
-- Automated YouTube search using Selenium WebDriver
+- Fast YouTube search through the InnerTube JSON API (single shared HTTP session)
+- Selenium WebDriver fallback when the HTTP search finds nothing
+- Runs several searches concurrently
 - Intelligent duplicate detection based on YouTube video IDs
 - Progress tracking with tqdm
 - Handles YouTube consent pages automatically
-- Updates centralized JSON database
+- Updates centralized JSON database (new entries appended to a journal, compacted periodically)
 - Preserves existing database entries
 
 Author: Claude Sonnet 3.5 (Anthropic) under supervision of Guillaume Blain
 """
 
-import sys, time, os, json
-from urllib.parse import quote_plus, urlparse, parse_qs
+import sys, time, os, json, random, threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote_plus
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import List, Optional, Dict, Any
 from datetime import datetime, timedelta
 
 # Absolute path to the JSON database (in the same folder as this script)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE_FILE = os.path.join(SCRIPT_DIR, 'tunes_database.json')
+# Append-only journal of entries added since the last full save (one JSON object per line)
+JOURNAL_FILE = os.path.join(SCRIPT_DIR, 'tunes_database.jsonl')
+COMPACT_JOURNAL_BYTES = 64 * 1024   # Rewrite the JSON database once the journal exceeds this size
 
+import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
 from webdriver_manager.chrome import ChromeDriverManager
@@ -42,12 +50,42 @@ except ImportError:
     TQDM_AVAILABLE = False
     print("[INFO] tqdm not available. Recommended installation: pip install tqdm")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Known YouTube consent page hostnames
 CONSENT_HOSTS = ("consent.youtube.com", "consent.google.com")
 
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+              "AppleWebKit/537.36 (KHTML, like Gecko) "
+              "Chrome/120.0.0.0 Safari/537.36")
+
+_LOWER = "translate(normalize-space(.), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
+CONSENT_BUTTONS_XPATH = (
+    f"//button[contains({_LOWER}, 'i agree') or contains({_LOWER}, 'accept all')"
+    f" or contains({_LOWER}, 'j’accepte')]"
+)
+
+# Page content served instead of results when YouTube throttles the client
+RATE_LIMIT_MARKERS = ("g-recaptcha", "confirm you’re not a bot", "confirm you're not a bot")
+
+# Disk cache of the fallback browser, kept between runs
+BROWSER_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "autoyt2mp3")
+
+# Pre-accepted consent cookie: YouTube serves results directly instead of the consent page
+CONSENT_COOKIE = ("CONSENT", "YES+1")
+
+# InnerTube search endpoint used by the YouTube web client (compact JSON, no HTML rendering)
+INNERTUBE_SEARCH_URL = "https://www.youtube.com/youtubei/v1/search?prettyPrint=false"
+INNERTUBE_CLIENT = {"clientName": "WEB", "clientVersion": "2.20240101.00.00", "hl": "en"}
+
+@lru_cache(maxsize=None)
 def extract_video_id(youtube_url):
     """
-    Extract YouTube video ID from URL.
+    Extract YouTube video ID from URL (memoized: the same URLs are parsed repeatedly).
     
     Args:
         youtube_url (str): YouTube URL to parse
@@ -55,57 +93,147 @@ def extract_video_id(youtube_url):
     Returns:
         str|None: Video ID if found, None otherwise
     """
-    parsed_url = urlparse(youtube_url)
-    if parsed_url.hostname in ('www.youtube.com', 'youtube.com'):
-        if parsed_url.path == '/watch':
-            return parse_qs(parsed_url.query).get('v', [None])[0]
+    # Plain string splitting: same checks as urlparse/parse_qs without the intermediate objects
+    _, sep, rest = youtube_url.partition("://")
+    if not sep:
+        return None
+    location, _, query = rest.partition("?")
+    host, _, path = location.partition("/")
+    # Ignorer "user@" et ":port" comme urlparse().hostname
+    host = host.rpartition("@")[2].partition(":")[0]
+    if host.lower() not in ('www.youtube.com', 'youtube.com') or path != 'watch':
+        return None
+    for param in query.partition("#")[0].split("&"):
+        # parse_qs ignore les valeurs vides: "v=&v=abc" donne "abc"
+        if param.startswith("v=") and len(param) > 2:
+            return param[2:]
     return None
 
+# The journal and the load/save functions below are duplicated in code/conversion.py and
+# manage_database.py (each script runs standalone): change the three copies together
+def read_journal():
+    """
+    Read the entries appended to the journal since the last full save.
+    
+    Returns:
+        list: Journal entries (an incomplete last line from an interrupted run is skipped)
+    """
+    entries = []
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    pass
+    return entries
+
+def append_to_journal(entries):
+    """
+    Append new entries to the journal without rewriting the database.
+    
+    Args:
+        entries (list): Database entries to append
+    """
+    with open(JOURNAL_FILE, 'a', encoding='utf-8') as f:
+        for entry in entries:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+def journal_needs_compaction():
+    """
+    Check whether the journal should be folded into the JSON database.
+    
+    Returns:
+        bool: True if the JSON database is missing or the journal grew past COMPACT_JOURNAL_BYTES
+    """
+    if not os.path.exists(JOURNAL_FILE):
+        return False
+    return not os.path.exists(DATABASE_FILE) or os.path.getsize(JOURNAL_FILE) > COMPACT_JOURNAL_BYTES
+
 def load_database():
     """
-    Load the existing database from JSON file.
+    Load the existing database from JSON file, followed by the journal entries.
     
     Returns:
         list: Database entries or empty list if file doesn't exist
     """
+    data = []
     if os.path.exists(DATABASE_FILE):
         try:
-            with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
-            return []
-    return []
+            if ORJSON_AVAILABLE:
+                with open(DATABASE_FILE, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (ValueError, OSError) as e:  # JSONDecodeError is a ValueError
+            # Stop rather than rebuild the database from scratch over the unreadable file
+            print(f"[ERROR] Unable to read database '{DATABASE_FILE}': {e}")
+            sys.exit(1)
+    return data + read_journal()
 
 def save_database(data):
     """
-    Save the database to JSON file.
+    Save the full database to JSON file and clear the journal it now contains.
+    
+    The file is written to a temporary file then swapped in with os.replace,
+    so an interrupted save never leaves a truncated database behind.
     
     Args:
         data (list): Database entries to save
     """
-    with open(DATABASE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    tmp_file = DATABASE_FILE + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, DATABASE_FILE)
+    if os.path.exists(JOURNAL_FILE):
+        os.remove(JOURNAL_FILE)
+
+def build_video_index(database):
+    """
+    Index database entries by YouTube video ID.
+    
+    Args:
+        database (list): Current database entries
+        
+    Returns:
+        dict: Video ID -> entry (first entry wins when several share an ID)
+    """
+    id_to_entry = {}
+    for entry in database:
+        video_id = extract_video_id(entry['url'])
+        if video_id:
+            id_to_entry.setdefault(video_id, entry)
+    return id_to_entry
 
-def check_duplicate(new_url, database):
+def check_duplicate(new_url, id_to_entry):
     """
     Check if URL already exists in database based on video ID.
     
     Args:
         new_url (str): YouTube URL to check
-        database (list): Current database entries
+        id_to_entry (dict): Video ID index built by build_video_index
         
     Returns:
         dict|None: Existing entry if duplicate found, None otherwise
     """
+    # Nothing to compare against (first run): skip URL parsing entirely
+    if not id_to_entry:
+        return None
     new_video_id = extract_video_id(new_url)
     if not new_video_id:
         return None
-    
-    for entry in database:
-        existing_video_id = extract_video_id(entry['url'])
-        if existing_video_id == new_video_id:
-            return entry
-    return None
+    return id_to_entry.get(new_video_id)
 
 @dataclass
 class Config:
@@ -115,13 +243,21 @@ class Config:
     Attributes:
         headless (bool): Run browser in headless mode
         timeout (int): Timeout in seconds for web operations
-        pause_between_queries (float): Delay between searches to avoid rate limiting
+        pause_between_queries (float): Optional fixed delay after each search
         region_code (str): YouTube region code (optional, YouTube auto-adjusts)
+        browser_fallback (bool): Retry with Selenium when the HTTP search finds nothing
+        concurrent_queries (int): Number of searches running at the same time
+        max_retries (int): Retries of a throttled or failed search
+        backoff_base (float): First retry delay in seconds (doubled on each retry)
     """
     headless: bool = True
     timeout: int = 15           # seconds for waits
-    pause_between_queries: float = 0.8  # light throttling
+    pause_between_queries: float = 0.0  # backoff only kicks in when YouTube throttles
     region_code: str = "CA"     # optional (YouTube adjusts anyway)
+    browser_fallback: bool = True
+    concurrent_queries: int = 8
+    max_retries: int = 4
+    backoff_base: float = 0.5
 
 def build_driver(cfg: Config) -> webdriver.Chrome:
     """
@@ -141,20 +277,41 @@ def build_driver(cfg: Config) -> webdriver.Chrome:
     chrome_opts.add_argument("--disable-dev-shm-usage")
     chrome_opts.add_argument("--window-size=1200,1200")
     chrome_opts.add_argument("--lang=en-US,en;q=0.9")
-    chrome_opts.add_argument("--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                             "AppleWebKit/537.36 (KHTML, like Gecko) "
-                             "Chrome/120.0.0.0 Safari/537.36")
+    chrome_opts.add_argument(f"--user-agent={USER_AGENT}")
+    # Thumbnails and styling are not needed to read result links
+    chrome_opts.add_argument("--blink-settings=imagesEnabled=false")
+    chrome_opts.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.managed_default_content_settings.stylesheets": 2,
+    })
+    # Persistent cache: YouTube's scripts are reused from disk on later runs
+    chrome_opts.add_argument(f"--disk-cache-dir={BROWSER_CACHE_DIR}")
+    chrome_opts.add_argument("--disk-cache-size=104857600")
 
     # Selenium Manager via webdriver-manager
     driver = webdriver.Chrome(service=ChromeService(ChromeDriverManager().install()),
                               options=chrome_opts)
     driver.set_page_load_timeout(cfg.timeout + 10)
+
+    # Pre-accept consent without an extra page load (same cookie as the HTTP session)
+    try:
+        driver.execute_cdp_cmd("Network.setCookie", {
+            "name": CONSENT_COOKIE[0],
+            "value": CONSENT_COOKIE[1],
+            "domain": ".youtube.com",
+            "path": "/",
+        })
+    except WebDriverException:
+        pass
     return driver
 
 def maybe_handle_consent(driver: webdriver.Chrome, cfg: Config):
     """
     Handle YouTube consent page if it appears by clicking the accept button.
     
+    The consent cookie set in build_driver normally prevents this page; when it
+    still shows up, all known button labels are probed with a single query.
+    
     Args:
         driver (webdriver.Chrome): WebDriver instance
         cfg (Config): Configuration object
@@ -165,28 +322,20 @@ def maybe_handle_consent(driver: webdriver.Chrome, cfg: Config):
         current_host = ""
     if not any(h in current_host for h in CONSENT_HOSTS):
         return
-    wait = WebDriverWait(driver, cfg.timeout)
-    # Try multiple possible button labels
-    candidates = [
-        "//button//*[contains(text(),'I agree')]/ancestor::button",
-        "//button//*[contains(text(),'Accept all')]/ancestor::button",
-        "//button[contains(.,'I agree')]",
-        "//button[contains(.,'Accept all')]",
-        "//button[contains(.,'J’accepte tout') or contains(.,'J’accepte')]",
-    ]
-    for xp in candidates:
-        try:
-            btn = wait.until(EC.element_to_be_clickable((By.XPATH, xp)))
-            btn.click()
-            time.sleep(0.5)
-            return
-        except TimeoutException:
-            continue
+    # One probe for every known label (case-folded), instead of one wait per label
+    # (hidden duplicate forms are common on consent pages: keep displayed buttons only)
+    buttons = [b for b in driver.find_elements(By.XPATH, CONSENT_BUTTONS_XPATH) if b.is_displayed()]
     # Si pas trouvé, on tente d’appuyer sur la première action visible
+    if not buttons:
+        buttons = [b for b in driver.find_elements(By.TAG_NAME, "button") if b.is_displayed()]
+    if not buttons:
+        return
     try:
-        any_btn = wait.until(EC.element_to_be_clickable((By.TAG_NAME, "button")))
-        any_btn.click()
-    except TimeoutException:
+        buttons[0].click()
+        WebDriverWait(driver, cfg.timeout).until(
+            lambda d: not any(h in d.current_url for h in CONSENT_HOSTS)
+        )
+    except (TimeoutException, WebDriverException):
         pass
 
 def first_video_url_from_results(driver: webdriver.Chrome, cfg: Config) -> Optional[str]:
@@ -211,17 +360,138 @@ def first_video_url_from_results(driver: webdriver.Chrome, cfg: Config) -> Optio
     except NoSuchElementException:
         return None
 
-def search_query_and_get_first_url(driver: webdriver.Chrome, query: str, cfg: Config) -> Optional[str]:
-    url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
+def build_session(cfg: Config) -> requests.Session:
+    """
+    Create the HTTP session shared by all YouTube searches (connection reuse).
+    
+    Args:
+        cfg (Config): Configuration object
+        
+    Returns:
+        requests.Session: Session with browser-like headers and the consent cookie
+    """
+    session = requests.Session()
+    session.headers.update({
+        "User-Agent": USER_AGENT,
+        "Accept-Language": "en-US,en;q=0.9",
+    })
+    session.cookies.set(*CONSENT_COOKIE, domain=".youtube.com")
+    return session
+
+def is_rate_limited(response: requests.Response) -> bool:
+    """
+    Detect YouTube throttling (HTTP 429, "sorry" redirect or bot-check page).
+    
+    Args:
+        response (requests.Response): Search page response
+        
+    Returns:
+        bool: True if the request should be retried later
+    """
+    if response.status_code == 429 or "/sorry/" in response.url:
+        return True
+    return any(marker in response.text for marker in RATE_LIMIT_MARKERS)
+
+def first_video_id(payload: Dict[str, Any]) -> Optional[str]:
+    """
+    Return the ID of the first organic video in an InnerTube search response.
+    
+    Only videoRenderer items are considered (ads, shorts and playlists use other renderers).
+    
+    Args:
+        payload (dict): Decoded InnerTube search response
+        
+    Returns:
+        str|None: Video ID, or None if the response holds no video
+    """
     try:
-        driver.get(url)
-    except WebDriverException:
-        # Retry unique si ça plante
-        time.sleep(1.0)
-        driver.get(url)
+        sections = (payload["contents"]["twoColumnSearchResultsRenderer"]["primaryContents"]
+                    ["sectionListRenderer"]["contents"])
+    except (KeyError, TypeError):
+        return None
+    for section in sections:
+        for item in section.get("itemSectionRenderer", {}).get("contents", []):
+            video_id = item.get("videoRenderer", {}).get("videoId")
+            if video_id:
+                return video_id
+    return None
 
-    maybe_handle_consent(driver, cfg)
-    return first_video_url_from_results(driver, cfg)
+def http_search_first_url(session: requests.Session, query: str, cfg: Config) -> Optional[str]:
+    """
+    Search YouTube through the InnerTube API and return the first organic video URL.
+    
+    Args:
+        session (requests.Session): Session built by build_session
+        query (str): Search query
+        cfg (Config): Configuration object
+        
+    Returns:
+        str|None: Video URL, or None if the search failed or returned no video
+    """
+    body = {"context": {"client": dict(INNERTUBE_CLIENT, gl=cfg.region_code)}, "query": query}
+    for attempt in range(cfg.max_retries + 1):
+        try:
+            response = session.post(INNERTUBE_SEARCH_URL, json=body, timeout=cfg.timeout)
+            if not is_rate_limited(response):
+                response.raise_for_status()
+                break
+        except (requests.Timeout, requests.ConnectionError):
+            pass
+        except requests.RequestException:
+            return None
+        if attempt == cfg.max_retries:
+            return None
+        # Exponential backoff with jitter, only after a failed or throttled request
+        time.sleep(min(60.0, cfg.backoff_base * 2 ** attempt) * random.uniform(0.8, 1.2))
+    try:
+        video_id = first_video_id(response.json())
+    except ValueError:
+        return None
+    if not video_id:
+        return None
+    return f"https://www.youtube.com/watch?v={video_id}"
+
+class BrowserSearch:
+    """
+    Selenium-based YouTube search, used only as a fallback.
+    
+    The Chrome instance is started on first use, so runs where the HTTP
+    search always succeeds never launch a browser. Calls are serialized:
+    a single driver must not be used from several threads at once.
+    """
+
+    def __init__(self, cfg: Config):
+        self.cfg = cfg
+        self.driver: Optional[webdriver.Chrome] = None
+        self.lock = threading.Lock()
+
+    def first_url(self, query: str) -> Optional[str]:
+        with self.lock:
+            if self.driver is None:
+                self.driver = build_driver(self.cfg)
+            url = f"https://www.youtube.com/results?search_query={quote_plus(query)}"
+            try:
+                self.driver.get(url)
+            except WebDriverException:
+                # Retry unique si ça plante
+                time.sleep(1.0)
+                self.driver.get(url)
+
+            maybe_handle_consent(self.driver, self.cfg)
+            return first_video_url_from_results(self.driver, self.cfg)
+
+    def quit(self):
+        with self.lock:
+            if self.driver is not None:
+                self.driver.quit()
+                self.driver = None
+
+def search_query_and_get_first_url(session: requests.Session, browser: BrowserSearch,
+                                   query: str, cfg: Config) -> Optional[str]:
+    url = http_search_first_url(session, query, cfg)
+    if url or not cfg.browser_fallback:
+        return url
+    return browser.first_url(query)
 
 def read_lines(path: str) -> List[str]:
     with open(path, "r", encoding="utf-8") as f:
@@ -236,8 +506,20 @@ def main(in_txt: str):
         print("[ERREUR] Le fichier d'entrée ne contient aucune ligne.")
         sys.exit(2)
 
-    # Charger la base de données existante
+    # Charger la base de données existante et l'indexer par ID vidéo
     database = load_database()
+    id_to_entry = build_video_index(database)
+    
+    # Ignorer les requêtes répétées et celles déjà présentes dans la base (titre = requête)
+    read_count = len(queries)
+    queries = list(dict.fromkeys(queries))
+    existing_titles = {e.get('title', '').lower() for e in database}
+    queries = [q for q in queries if q.lower() not in existing_titles]
+    if len(queries) < read_count:
+        print(f"[INFO] {read_count - len(queries)} requêtes ignorées (répétées ou déjà dans la base)")
+    if not queries:
+        print("[INFO] No new queries to search")
+        return
     
     print(f"[INFO] {len(queries)} requêtes à traiter")
     
@@ -253,36 +535,37 @@ def main(in_txt: str):
             total=len(queries),
             desc="YouTube Search",
             unit="query",
+            mininterval=0.5,
             bar_format="{l_bar}{bar}| {n_fmt}/{total_fmt} [{elapsed}<{remaining}, {rate_fmt}]"
         )
     
-    driver = build_driver(cfg)
+    session = build_session(cfg)
+    browser = BrowserSearch(cfg)
+    
+    def search_one(q: str) -> Optional[str]:
+        url = search_query_and_get_first_url(session, browser, f"song: {q}", cfg)
+        if cfg.pause_between_queries > 0:
+            time.sleep(cfg.pause_between_queries)
+        return url
+    
+    # Searches run concurrently; results are consumed in input order
+    executor = ThreadPoolExecutor(max_workers=cfg.concurrent_queries)
+    futures = [executor.submit(search_one, q) for q in queries]
     
     try:
-        for idx, q in enumerate(queries, 1):
-            # Calculate time estimation
-            if processed_count > 0:
-                elapsed_time = datetime.now() - start_time
-                avg_time_per_item = elapsed_time / processed_count
-                remaining_items = len(queries) - processed_count
-                estimated_remaining = avg_time_per_item * remaining_items
-                estimated_end = datetime.now() + estimated_remaining
-                
-                progress_info = f"ETA: {estimated_end.strftime('%H:%M:%S')}"
-            else:
-                progress_info = "Calculating..."
-            
-            # Update progress bar
-            if TQDM_AVAILABLE:
-                progress_bar.set_description(f"Search: {q[:25]}...")
-                progress_bar.set_postfix_str(f"New: {len(new_entries)}, Duplicates: {len(duplicates_found)}")
+        for idx, (q, future) in enumerate(zip(queries, futures), 1):
+            # Update progress bar text every 10 queries (tqdm shows rate and ETA itself)
+            if TQDM_AVAILABLE and (idx == 1 or idx % 10 == 0):
+                progress_bar.set_description(f"Search: {q[:25]}...", refresh=False)
+                progress_bar.set_postfix_str(f"New: {len(new_entries)}, Duplicates: {len(duplicates_found)}",
+                                             refresh=False)
             
             print(f"[{idx}/{len(queries)}] Search: {q}")
-            url = search_query_and_get_first_url(driver, f"song: {q}", cfg)
+            url = future.result()
 
             if url:
                 # Check if this URL already exists in the database
-                duplicate = check_duplicate(url, database)
+                duplicate = check_duplicate(url, id_to_entry)
                 if duplicate:
                     print(f" -> DUPLICATE DETECTED: '{q}'")
                     print(f"    Existing title: {duplicate['title']}")
@@ -305,6 +588,12 @@ def main(in_txt: str):
                         "project": ""  # To be filled manually
                     }
                     new_entries.append(result_obj)
+                    # Persist right away: an interrupted run keeps every result found so far
+                    append_to_journal([result_obj])
+                    # Catch duplicates within this run as well
+                    video_id = extract_video_id(url)
+                    if video_id:
+                        id_to_entry[video_id] = result_obj
             else:
                 print(" -> No results found")
             
@@ -314,17 +603,20 @@ def main(in_txt: str):
             # Update progress bar
             if TQDM_AVAILABLE:
                 progress_bar.update(1)
-            
-            time.sleep(cfg.pause_between_queries)
     finally:
-        driver.quit()
+        # Drop searches not started yet (e.g. on Ctrl-C), then wait for running ones
+        for future in futures:
+            future.cancel()
+        executor.shutdown(wait=True)
+        browser.quit()
+        session.close()
         # Close progress bar
         if TQDM_AVAILABLE:
             progress_bar.close()
 
-    # Update database with new entries only
-    if new_entries:
-        database.extend(new_entries)
+    # New entries are already in the journal; rewrite the JSON database only when it grew enough
+    database.extend(new_entries)
+    if journal_needs_compaction():
         save_database(database)
     
     # Calculate final statistics
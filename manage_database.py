@@ -10,6 +10,7 @@ Key Features:
 - Update project information for specific entries
 - Search entries by project name
 - Show database statistics
+- Fold the journal of new search results into the JSON file
 - Interactive menu-driven interface
 
 Author: Claude Sonnet 3.5 (Anthropic) under supervision of Guillaume Blain
@@ -17,35 +18,113 @@ Author: Claude Sonnet 3.5 (Anthropic) under supervision of Guillaume Blain
 
 import json
 import os
+from collections import Counter, defaultdict
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Path to the database (in the code subfolder relative to this script)
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 DATABASE_FILE = os.path.join(SCRIPT_DIR, "code", 'tunes_database.json')
+# Entries added by update_db_from_txt.py since the last full save
+JOURNAL_FILE = os.path.join(SCRIPT_DIR, "code", 'tunes_database.jsonl')
+
+# Set when the database file exists but cannot be read: saving would overwrite it
+_load_failed = False
+
+# The journal and the load/save functions below are duplicated in code/conversion.py and
+# code/update_db_from_txt.py (each script runs standalone): change the three copies together
+def read_journal():
+    """
+    Read the entries appended to the journal since the last full save.
+    
+    Returns:
+        list: Journal entries (an incomplete last line from an interrupted run is skipped)
+    """
+    entries = []
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, 'r', encoding='utf-8') as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except ValueError:
+                    pass
+    return entries
 
 def load_database():
     """
-    Load the existing database from JSON file.
+    Load the existing database from JSON file, followed by the journal entries.
     
     Returns:
-        list: Database entries or empty list if file doesn't exist
+        list: Database entries or empty list if file doesn't exist or can't be read
     """
+    global _load_failed
+    _load_failed = False
+    data = []
     if os.path.exists(DATABASE_FILE):
         try:
-            with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except:
+            if ORJSON_AVAILABLE:
+                with open(DATABASE_FILE, 'rb') as f:
+                    data = orjson.loads(f.read())
+            else:
+                with open(DATABASE_FILE, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+        except (ValueError, OSError) as e:  # JSONDecodeError is a ValueError
+            print(f"[ERROR] Unable to read database '{DATABASE_FILE}': {e}")
+            _load_failed = True
             return []
-    return []
+    return data + read_journal()
 
 def save_database(data):
     """
-    Save the database to JSON file.
+    Save the full database to JSON file and clear the journal it now contains.
+    
+    Same atomic write as code/update_db_from_txt.py (temporary file then os.replace).
     
     Args:
         data (list): Database entries to save
+        
+    Returns:
+        bool: True if saved, False if the last load failed and the file was left untouched
     """
-    with open(DATABASE_FILE, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    if _load_failed:
+        print(f"[ERROR] Not saving: '{DATABASE_FILE}' could not be read and would be overwritten")
+        return False
+    tmp_file = DATABASE_FILE + '.tmp'
+    if ORJSON_AVAILABLE:
+        with open(tmp_file, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+    else:
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp_file, DATABASE_FILE)
+    if os.path.exists(JOURNAL_FILE):
+        os.remove(JOURNAL_FILE)
+    return True
+
+def build_project_index(database):
+    """
+    Group database entries by lowercased project name.
+    
+    Args:
+        database (list): Database entries
+        
+    Returns:
+        dict: Lowercased project name -> list of entries, in database order
+    """
+    project_index = defaultdict(list)
+    for entry in database:
+        project_index[(entry.get('project', '') or '').lower()].append(entry)
+    return project_index
 
 def display_database():
     """
@@ -99,8 +178,8 @@ def update_project():
             new_project = input("New project (Enter to keep current): ").strip()
             if new_project:
                 entry['project'] = new_project
-                save_database(database)
-                print(f"✓ Project updated: '{new_project}'")
+                if save_database(database):
+                    print(f"✓ Project updated: '{new_project}'")
             else:
                 print("No changes made.")
         else:
@@ -124,7 +203,11 @@ def search_by_project():
     if not project_name:
         return
     
-    found_entries = [entry for entry in database if project_name.lower() in entry.get('project', '').lower()]
+    # Match against distinct project names rather than every entry
+    query = project_name.lower()
+    found_entries = [entry
+                     for project, entries in build_project_index(database).items() if query in project
+                     for entry in entries]
     
     if found_entries:
         print(f"\n=== RESULTS FOR PROJECT '{project_name}' ({len(found_entries)} entries) ===")
@@ -140,10 +223,21 @@ def search_by_project():
     else:
         print(f"No entries found for project '{project_name}'.")
 
+def compact_journal():
+    """
+    Fold the journal into the JSON database so the file can be edited by hand.
+    """
+    if not os.path.exists(JOURNAL_FILE):
+        print("No journal to fold: the JSON file is up to date.")
+        return
+    database = load_database()
+    if save_database(database):
+        print(f"✓ Journal folded into '{DATABASE_FILE}' ({len(database)} entries)")
+
 def main():
     """
     Main menu interface for database management.
-    Provides options to view, update, search, and show statistics.
+    Provides options to view, update, search, show statistics and fold the journal.
     """
     while True:
         print("\n" + "="*50)
@@ -153,6 +247,7 @@ def main():
         print("2. Update entry project")
         print("3. Search by project")
         print("4. Statistics")
+        print("5. Fold journal into database")
         print("0. Exit")
         print("-"*50)
         
@@ -170,6 +265,8 @@ def main():
                 search_by_project()
             elif choice == "4":
                 show_stats()
+            elif choice == "5":
+                compact_journal()
             else:
                 print("Invalid choice. Please try again.")
                 
@@ -188,14 +285,17 @@ def show_stats():
         return
     
     total = len(database)
-    completed = len([e for e in database if e.get('done') == True])
-    timeout = len([e for e in database if e.get('done') == "timeout"])
-    pending = len([e for e in database if e.get('done') == False])
-    
-    projects = {}
+    completed = timeout = pending = 0
+    projects = Counter()
     for entry in database:
-        project = entry.get('project', '') or "Not specified"
-        projects[project] = projects.get(project, 0) + 1
+        done = entry.get('done')
+        if done == True:
+            completed += 1
+        elif done == "timeout":
+            timeout += 1
+        elif done == False:
+            pending += 1
+        projects[entry.get('project', '') or "Not specified"] += 1
     
     print(f"\n=== STATISTICS ===")
     print(f"Total entries: {total}")